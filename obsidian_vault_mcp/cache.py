@@ -0,0 +1,119 @@
+"""On-disk cache of parsed notes, so startup only re-parses changed files."""
+
+import logging
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .parser import Note
+
+logger = logging.getLogger("obsidian_vault_mcp")
+
+# Bump whenever the pickled Note layout changes; older caches are discarded
+CACHE_VERSION = 5
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+class NoteCache:
+    """SQLite-backed store of pickled Note objects keyed by file path."""
+
+    def __init__(self, cache_path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_path: Path to the SQLite file
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.cache_path = cache_path
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self.conn.execute(pragma)
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS notes")
+            self.conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS notes (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                note BLOB NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def load(self) -> Dict[str, Tuple[int, int, bytes]]:
+        """
+        Read every cached row.
+
+        Returns:
+            Dictionary of path -> (mtime_ns, size, pickled note)
+        """
+        rows = self.conn.execute("SELECT path, mtime_ns, size, note FROM notes")
+        return {path: (mtime_ns, size, blob) for path, mtime_ns, size, blob in rows}
+
+    @staticmethod
+    def unpickle(blob: bytes) -> Optional[Note]:
+        """
+        Restore a cached note.
+
+        Args:
+            blob: Pickled note from load()
+
+        Returns:
+            Note object or None if the entry is unreadable
+        """
+        try:
+            note = pickle.loads(blob)
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry: {e}")
+            return None
+        return note if isinstance(note, Note) else None
+
+    def update(
+        self,
+        notes: Iterable[Tuple[Note, os.stat_result]],
+        removed: Iterable[str] = (),
+    ):
+        """
+        Store freshly parsed notes and drop rows for deleted files.
+
+        Args:
+            notes: (note, stat of its file when it was found) pairs
+            removed: Paths of files that no longer exist
+        """
+        rows = [
+            (str(note.path), stat.st_mtime_ns, stat.st_size,
+             pickle.dumps(note, protocol=pickle.HIGHEST_PROTOCOL))
+            for note, stat in notes
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO notes (path, mtime_ns, size, note) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.executemany(
+                "DELETE FROM notes WHERE path = ?",
+                ((path,) for path in removed),
+            )
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
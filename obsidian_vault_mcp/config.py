@@ -30,6 +30,16 @@ class VaultConfig(BaseModel):
         description="Folders to exclude from indexing and search"
     )
 
+    index_cache_path: Optional[Path] = Field(
+        default=None,
+        description="SQLite file caching parsed notes between runs (disabled when unset)"
+    )
+
+    watch_vault: bool = Field(
+        default=False,
+        description="Watch the vault for changes so refreshes only re-parse changed files (requires watchdog)"
+    )
+
     max_search_results: int = Field(
         default=100,
         description="Maximum number of search results to return"
@@ -129,6 +139,14 @@ def load_config(config_path: Optional[Path] = None) -> VaultConfig:
     if log_level_env:
         config_data["log_level"] = log_level_env
 
+    index_cache_env = os.getenv("OBSIDIAN_VAULT_INDEX_CACHE")
+    if index_cache_env:
+        config_data["index_cache_path"] = index_cache_env
+
+    watch_vault_env = os.getenv("OBSIDIAN_VAULT_WATCH")
+    if watch_vault_env:
+        config_data["watch_vault"] = watch_vault_env.lower() in ("1", "true", "yes")
+
     # Ensure vault_path is set
     if "vault_path" not in config_data:
         raise ValueError(
@@ -139,6 +157,9 @@ def load_config(config_path: Optional[Path] = None) -> VaultConfig:
     # Convert vault_path to Path object
     config_data["vault_path"] = Path(config_data["vault_path"]).expanduser().resolve()
 
+    if config_data.get("index_cache_path"):
+        config_data["index_cache_path"] = Path(config_data["index_cache_path"]).expanduser()
+
     # Validate vault exists
     if not config_data["vault_path"].exists():
         raise ValueError(
@@ -171,26 +192,3 @@ def get_para_location(file_path: Path, config: VaultConfig) -> Optional[str]:
 
     return None
 
-
-def is_excluded(file_path: Path, config: VaultConfig) -> bool:
-    """
-    Check if file path should be excluded from indexing.
-
-    Args:
-        file_path: Absolute path to check
-        config: VaultConfig instance
-
-    Returns:
-        True if file should be excluded
-    """
-    try:
-        relative_path = file_path.relative_to(config.vault_path)
-    except ValueError:
-        return True
-
-    # Check if any part of the path matches excluded folders
-    for part in relative_path.parts:
-        if part in config.exclude_folders:
-            return True
-
-    return False
@@ -1,25 +1,50 @@
 """Markdown and frontmatter parsing for Obsidian notes."""
 
+import os
 import re
+import sys
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any
 import frontmatter
 
+# Word characters that make up a search token
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Match [[link]], [[link|alias]], [[folder/link]], capturing the link target
+WIKILINK_PATTERN = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+
+# Separators between tags given as a single frontmatter string
+TAG_SEPARATOR_PATTERN = re.compile(r"[,\s]+")
+
+# Created dates that datetime.fromisoformat reads exactly as the strptime
+# formats in Note._extract_created would, without the slow strptime path
+ISO_CREATED_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?:[T ][0-9]{2}:[0-9]{2}:[0-9]{2})?")
+
 
 class Note:
     """Represents an Obsidian note with metadata."""
 
-    def __init__(self, path: Path, content: str):
+    def __init__(
+        self,
+        path: Path,
+        content: str,
+        vault_path: Optional[Path] = None,
+        stat: Optional[os.stat_result] = None,
+    ):
         """
         Initialize note from file path and content.
 
         Args:
             path: Absolute path to the note file
             content: Full file content including frontmatter
+            vault_path: Optional vault root, used to compute rel_path
+            stat: Stat of the file the content was read from; looked up if omitted
         """
         self.path = path
         self.title = path.stem
+        self.rel_path = self._get_rel_path(vault_path)
 
         # Parse frontmatter and content
         try:
@@ -34,14 +59,54 @@ class Note:
         # Extract common metadata fields
         self.tags = self._extract_tags()
         self.created = self._extract_created()
-        self.modified = self._get_modified_time()
+        self.mtime_ns: Optional[int] = None
+        self.size: Optional[int] = None
+        self.modified = self._get_modified_time(stat)
         self.para_location = self.metadata.get("para")
+        self._intern_fields()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only parsed fields; cached derived values are rebuilt on demand."""
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if not isinstance(getattr(Note, name, None), cached_property)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore a pickled note, re-interning its shared strings."""
+        self.__dict__.update(state)
+        self._intern_fields()
+
+    def _intern_fields(self):
+        """
+        Intern PARA location and tag strings.
+
+        These repeat across most of the vault, so notes share one string
+        object per value instead of holding their own copies.
+        """
+        if isinstance(self.para_location, str):
+            self.para_location = sys.intern(self.para_location)
+            self.metadata["para"] = self.para_location
+        self.tags = [sys.intern(tag) for tag in self.tags]
+
+    def _get_rel_path(self, vault_path: Optional[Path]) -> Optional[str]:
+        """Get the vault-relative path as a string, for prefix filtering."""
+        if vault_path is None:
+            return None
+        try:
+            return str(self.path.relative_to(vault_path))
+        except ValueError:
+            return None
 
-    def _get_modified_time(self) -> Optional[datetime]:
-        """Get modification time from file system."""
+    def _get_modified_time(self, stat: Optional[os.stat_result] = None) -> Optional[datetime]:
+        """Get modification time from file system, recording st_mtime_ns and st_size."""
         try:
-            mtime = self.path.stat().st_mtime
-            return datetime.fromtimestamp(mtime)
+            if stat is None:
+                stat = self.path.stat()
+            self.mtime_ns = stat.st_mtime_ns
+            self.size = stat.st_size
+            return datetime.fromtimestamp(stat.st_mtime)
         except (OSError, ValueError):
             return None
 
@@ -51,7 +116,7 @@ class Note:
 
         if isinstance(tags, str):
             # Handle comma-separated or space-separated tags
-            tags = [t.strip() for t in re.split(r"[,\s]+", tags) if t.strip()]
+            tags = [t.strip() for t in TAG_SEPARATOR_PATTERN.split(tags) if t.strip()]
         elif isinstance(tags, list):
             # Already a list
             tags = [str(t).strip() for t in tags if t]
@@ -72,6 +137,12 @@ class Note:
             return created
 
         if isinstance(created, str):
+            if ISO_CREATED_PATTERN.fullmatch(created):
+                try:
+                    return datetime.fromisoformat(created)
+                except ValueError:
+                    pass
+
             # Try common formats
             for fmt in [
                 "%Y-%m-%d",
@@ -86,6 +157,78 @@ class Note:
 
         return None
 
+    @cached_property
+    def wikilinks(self) -> List[str]:
+        """Linked note titles, parsed once from content."""
+        # Extract just the note title (remove folder path if present)
+        return [match.rsplit("/", 1)[-1] for match in WIKILINK_PATTERN.findall(self.content)]
+
+    @cached_property
+    def wikilink_set(self) -> FrozenSet[str]:
+        """Canonical linked note titles (lowercased, anchors and .md removed), for membership tests."""
+        targets = set()
+        for link in self.wikilinks:
+            # [[Note#Heading]] and [[Note#^block]] link to Note
+            target = link.split("#", 1)[0].strip().lower()
+            if target.endswith(".md"):
+                target = target[:-3]
+            if target:
+                targets.add(target)
+        return frozenset(targets)
+
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercased title and content, as searched by contains_text."""
+        return f"{self.title}\n{self.content}".lower()
+
+    @property
+    def content_offset(self) -> int:
+        """Offset of the content within text_lower."""
+        # Lowercasing can change the length of some characters, so measure
+        # the lowercased title rather than the original
+        return len(self.title.lower()) + 1
+
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset within text_lower of each content line start, for mapping hits to lines."""
+        text_lower = self.text_lower
+        starts = [self.content_offset]
+        pos = text_lower.find("\n", starts[0])
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = text_lower.find("\n", pos + 1)
+        return starts
+
+    @cached_property
+    def created_sort_key(self) -> datetime:
+        """Creation date for newest-first ordering; undated notes sort as datetime.min."""
+        return self.created or datetime.min
+
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        """Lowercase word tokens of the title and content."""
+        return frozenset(TOKEN_PATTERN.findall(self.text_lower))
+
+    def with_content(self, content: str) -> "Note":
+        """
+        Create a copy of this note with new body content and the same metadata.
+
+        Cached derived values (tokens, links, lowercased text) are not carried
+        over, and the modification time is re-read from disk.
+
+        Args:
+            content: Note content (without frontmatter)
+
+        Returns:
+            New Note object
+        """
+        note = Note.__new__(Note)
+        note.__dict__.update(self.__getstate__())
+        note.metadata = dict(self.metadata)
+        note.content = content
+        note.modified = note._get_modified_time()
+        return note
+
     def get_wikilinks(self) -> List[str]:
         """
         Extract all wikilinks from the note content.
@@ -93,19 +236,7 @@ class Note:
         Returns:
             List of linked note titles (without [[ ]])
         """
-        # Match [[link]], [[link|alias]], [[folder/link]]
-        pattern = r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]"
-        matches = re.findall(pattern, self.content)
-
-        # Extract just the note title (remove folder path if present)
-        links = []
-        for match in matches:
-            if "/" in match:
-                links.append(match.split("/")[-1])
-            else:
-                links.append(match)
-
-        return links
+        return list(self.wikilinks)
 
     def contains_text(self, query: str, case_sensitive: bool = False) -> bool:
         """
@@ -118,13 +249,26 @@ class Note:
         Returns:
             True if query found in content or title
         """
-        search_content = f"{self.title}\n{self.content}"
-
         if not case_sensitive:
-            search_content = search_content.lower()
-            query = query.lower()
+            return query.lower() in self.text_lower
+
+        return self.contains_exact(query)
+
+    def contains_exact(self, query: str) -> bool:
+        """
+        Case-sensitive contains_text, without building the joined title and content.
 
-        return query in search_content
+        Args:
+            query: Search term
+
+        Returns:
+            True if query found in content or title
+        """
+        if "\n" in query:
+            # Only a query with a newline can span the title/content boundary
+            return query in f"{self.title}\n{self.content}"
+
+        return query in self.title or query in self.content
 
     def matches_criteria(
         self,
@@ -175,6 +319,17 @@ class Note:
         Returns:
             Dictionary with note data
         """
+        # Shallow copy: callers add keys (snippets, links) to the result
+        data = dict(self._summary)
+
+        if include_content:
+            data["content"] = self.content
+
+        return data
+
+    @cached_property
+    def _summary(self) -> Dict[str, Any]:
+        """Dictionary form without content, built once per note."""
         data = {
             "title": self.title,
             "path": str(self.path),
@@ -189,42 +344,50 @@ class Note:
         if self.modified:
             data["modified"] = self.modified.isoformat()
 
-        if include_content:
-            data["content"] = self.content
-
         return data
 
 
-def parse_note(file_path: Path) -> Optional[Note]:
+def parse_note(file_path: Path, vault_path: Optional[Path] = None) -> Optional[Note]:
     """
     Parse a note file into a Note object.
 
     Args:
         file_path: Path to the note file
+        vault_path: Optional vault root, used to compute the note's rel_path
 
     Returns:
         Note object or None if parsing failed
     """
-    if not file_path.exists() or file_path.suffix != ".md":
+    if file_path.suffix != ".md":
         return None
 
     try:
+        # Stat the open file rather than the path: one syscall fewer, and the
+        # recorded mtime can't be newer than the content read
         with open(file_path, "r", encoding="utf-8") as f:
+            stat = os.fstat(f.fileno())
             content = f.read()
-        return Note(file_path, content)
+        return Note(file_path, content, vault_path, stat)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         # Log error but don't crash
         print(f"Error parsing {file_path}: {e}")
         return None
 
 
-def resolve_wikilink(link: str, vault_path: Path) -> Optional[Path]:
+def resolve_wikilink(
+    link: str,
+    vault_path: Path,
+    exclude_folders: Iterable[str] = (".obsidian", ".trash"),
+) -> Optional[Path]:
     """
     Resolve a wikilink to its target file path.
 
     Args:
         link: Wikilink text (with or without [[ ]])
         vault_path: Path to vault root
+        exclude_folders: Folder names whose contents are never link targets
 
     Returns:
         Absolute path to target note or None if not found
@@ -245,11 +408,27 @@ def resolve_wikilink(link: str, vault_path: Path) -> Optional[Path]:
 
     # Search for note by title
     note_name = link.split("/")[-1]  # Get just the note name
+    file_name = f"{note_name}.md"
 
-    # Recursive search through vault
-    for md_file in vault_path.rglob(f"{note_name}.md"):
-        # Exclude .obsidian and .trash folders
-        if ".obsidian" not in md_file.parts and ".trash" not in md_file.parts:
-            return md_file
+    # Walk the vault top-down, pruning excluded folders before descending
+    excluded = frozenset(exclude_folders)
+    pending = [str(vault_path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+
+        subdirs = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded:
+                        subdirs.append(entry.path)
+                elif entry.name == file_name and entry.is_file():
+                    return Path(entry.path)
+
+        # Visit subfolders in listing order
+        pending.extend(reversed(subdirs))
 
     return None
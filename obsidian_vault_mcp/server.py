@@ -515,15 +515,15 @@ def create_server(config: VaultConfig) -> Server:
         """List available note resources."""
         # Use internal index directly to bypass config limits for resources
         # and get Note objects directly. Limit to 1000 recent notes.
+        vault.index.apply_pending_changes()
         notes = vault.index.list_notes(limit=1000)
         resources = []
         
         for note in notes:
             try:
-                # Create relative path URI
-                # note.path is already a Path object
-                rel_path = note.path.relative_to(config.vault_path)
-                uri = f"note://internal/{urllib.parse.quote(str(rel_path))}"
+                # Create relative path URI from the path cached at parse time
+                rel_path = note.rel_path or str(note.path.relative_to(config.vault_path))
+                uri = f"note://internal/{urllib.parse.quote(rel_path)}"
                 
                 resources.append(Resource(
                     uri=uri,
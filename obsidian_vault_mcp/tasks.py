@@ -102,6 +102,7 @@ class TaskParser:
     PRIORITY_MEDIUM = re.compile(r'🔼')
     PRIORITY_LOW = re.compile(r'🔽')
     RECURRENCE_PATTERN = re.compile(r'🔁 (.+?)(?:\s|$)')
+    HASHTAG_PATTERN = re.compile(r'#(\w+)')
 
     # Blocked task indicators
     BLOCKED_KEYWORDS = [
@@ -191,7 +192,7 @@ class TaskParser:
     @staticmethod
     def _extract_tags(content: str) -> List[str]:
         """Extract hashtags from task content."""
-        return re.findall(r'#(\w+)', content)
+        return TaskParser.HASHTAG_PATTERN.findall(content)
 
     @staticmethod
     def _is_blocked(content: str) -> bool:
@@ -413,10 +414,11 @@ def gather_topic(vault_reader, topic: str, include_backlinks: bool = True, max_d
     Returns:
         Dictionary with aggregated topic information
     """
-    import re
-
-    # Search for notes containing the topic
-    search_results = vault_reader.search_notes(query=topic, limit=50)
+    # Search for notes containing the topic; the search locates snippets on
+    # the index's cached lowercase text
+    search_results = vault_reader.search_notes(
+        query=topic, limit=50, include_snippets=True, context_lines=2
+    )
 
     # Also search by tag if it looks like a tag
     tag_results = []
@@ -436,34 +438,32 @@ def gather_topic(vault_reader, topic: str, include_backlinks: bool = True, max_d
     notes_with_content = []
     for note_meta in all_notes:
         try:
-            note_data = vault_reader.read_note(path=note_meta['path'])
+            # resolve_links returns the wikilinks the index already parsed
+            note_data = vault_reader.read_note(path=note_meta['path'], resolve_links=True)
             if not note_data:
                 continue
 
             content = note_data.get('content', '')
 
-            # Extract snippets containing the topic
-            snippets = []
-            lines = content.split('\n')
-            topic_lower = topic.lower()
-
-            for i, line in enumerate(lines):
-                if topic_lower in line.lower():
-                    # Get surrounding context (2 lines before/after)
-                    start = max(0, i - 2)
-                    end = min(len(lines), i + 3)
-                    snippet = '\n'.join(lines[start:end])
-                    snippets.append({
-                        'line': i + 1,
-                        'text': snippet.strip()
-                    })
-
-            # Get wikilinks from note
-            links = []
-            link_pattern = r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]"
-            for match in re.findall(link_pattern, content):
-                link_name = match.split('/')[-1] if '/' in match else match
-                links.append(link_name)
+            # Extract snippets containing the topic, unless the search already did
+            snippets = note_meta.get('snippets')
+            if snippets is None:
+                snippets = []
+                lines = content.split('\n')
+                topic_lower = topic.lower()
+
+                for i, line in enumerate(lines):
+                    if topic_lower in line.lower():
+                        # Get surrounding context (2 lines before/after)
+                        start = max(0, i - 2)
+                        end = min(len(lines), i + 3)
+                        snippet = '\n'.join(lines[start:end])
+                        snippets.append({
+                            'line': i + 1,
+                            'text': snippet.strip()
+                        })
+
+            links = note_data.get('links', [])
 
             notes_with_content.append({
                 'title': note_data['title'],
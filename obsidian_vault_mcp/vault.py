@@ -1,21 +1,332 @@
 """Vault operations for reading and searching Obsidian notes."""
 
-import base64
+import binascii
+import bisect
 import hashlib
+import heapq
+import io
+import itertools
 import logging
+import os
+import queue
 import re
+import sqlite3
 import tempfile
+import time
 import shutil
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Callable, FrozenSet, Iterable, Iterator, Set, Tuple, Union
 
 import frontmatter
+import yaml
+
+# Prefer libyaml's C loader and dumper; python-frontmatter already does the same
+try:
+    from yaml import CSafeDumper as _YAMLDumper, CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper, SafeLoader as _YAMLLoader
 
 logger = logging.getLogger("obsidian_vault_mcp")
 
-from .config import VaultConfig, get_para_location, is_excluded
-from .parser import Note, parse_note, resolve_wikilink
+# Optional: filesystem notifications for incremental refresh
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+from .cache import NoteCache
+from .config import VaultConfig, get_para_location
+from .parser import TOKEN_PATTERN, Note, parse_note, resolve_wikilink
+
+# File reads release the GIL, so I/O-bound fan-out can use more threads than cores
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Below this many files, parsing serially beats the thread pool's startup cost
+PARALLEL_PARSE_MIN_FILES = 200
+
+# Number of recent (query, case_sensitive) match lists kept by VaultIndex
+SEARCH_MEMO_SIZE = 64
+
+# Buffer note writes in large blocks so big notes need few write syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Bytes read from the end of a note to find where an appended section starts
+APPEND_TAIL_SIZE = 4096
+
+# Base64 payload without whitespace, padded to a multiple of 4 characters
+_BASE64_RE = re.compile(r"(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?")
+
+# Base64 characters decoded per chunk when streaming attachments (multiple of 4)
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# Characters not allowed in note filenames, removed via str.translate
+_FILENAME_UNSAFE_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
+# Runs of whitespace, collapsed to a single space in filenames
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Daily-note task lines and the annotations stripped from their text
+_CHECKED_TASK_RE = re.compile(r'^-\s*\[x\]\s+(.+?)(?:\s*✅\s*(\d{4}-\d{2}-\d{2}))?$', re.IGNORECASE)
+_UNCHECKED_TASK_RE = re.compile(r'^-\s*\[ \]\s+(.+)$')
+_ADDED_DATE_RE = re.compile(r'\(added\s+([^)]+)\)')
+_ADDED_NOTE_RE = re.compile(r'\s*\(added[^)]*\)\s*')
+_COMPLETION_SUFFIX_RE = re.compile(r'\s*✅.*$')
+_WARNING_SUFFIX_RE = re.compile(r'\s*⚠️.*$')
+_AGE_DAYS_RE = re.compile(r'⚠️\s*\*?(\d+)\s*days')
+
+# Markdown heading (levels 2-4), capturing its text
+_HEADING_RE = re.compile(r'^#{2,4}\s+(.+)$')
+
+# Matches a section start marker, capturing the section name; the name may
+# not run into another marker, so markers sharing a line are all found
+_SECTION_START_RE = re.compile(r"<!-- SECTION:((?:(?!<!-- SECTION:)[^\n])+?):START -->")
+
+
+def _format_now(fmt: str) -> str:
+    """Format the current local time via time.strftime, without a datetime object."""
+    return time.strftime(fmt, time.localtime())
+
+
+def _normalize_folder(folder: Optional[str]) -> str:
+    """
+    Normalize a folder filter to a vault-relative folder bucket key.
+
+    "1 - Projects" and "1 - Projects/" both become "1 - Projects", which
+    matches notes anywhere under that folder but not "1 - Projects Archive".
+    Forward slashes become os.sep, matching how bucket keys are built.
+
+    Args:
+        folder: Vault-relative folder path, or None
+
+    Returns:
+        The folder key, or "" when there is no folder filter
+    """
+    return (folder or "").rstrip("/" + os.sep).replace("/", os.sep)
+
+
+def _date_micros(value: datetime) -> int:
+    """
+    Convert a date to the int64 microsecond count stored in the date columns.
+
+    Timezone-aware dates are converted to UTC first.
+
+    Args:
+        value: Date to convert
+
+    Returns:
+        Microseconds since datetime.min
+    """
+    offset = value.utcoffset()
+    if offset is not None:
+        value = (value - offset).replace(tzinfo=None)
+    delta = value - datetime.min
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _compile_created_filter(
+    created_after: Optional[datetime],
+    created_before: Optional[datetime],
+) -> Optional[Callable[[Note], bool]]:
+    """
+    Build a predicate for a creation date range, testing only the bounds that are set.
+
+    Undated notes pass, as in Note.matches_criteria.
+
+    Args:
+        created_after: Minimum creation date
+        created_before: Maximum creation date
+
+    Returns:
+        Predicate over notes, or None if neither bound is set
+    """
+    if created_after and created_before:
+        return lambda note: not note.created or created_after <= note.created <= created_before
+    if created_after:
+        return lambda note: not note.created or note.created >= created_after
+    if created_before:
+        return lambda note: not note.created or note.created <= created_before
+    return None
+
+
+def _compile_modified_filter(
+    modified_after: Optional[datetime],
+    modified_before: Optional[datetime],
+) -> Callable[[Note], bool]:
+    """
+    Build a predicate for a modification date range.
+
+    A note's date is its modification time, falling back to its creation
+    date; notes with neither never match.
+
+    Args:
+        modified_after: Minimum modification date
+        modified_before: Maximum modification date
+
+    Returns:
+        Predicate over notes
+    """
+    def in_range(note: Note) -> bool:
+        changed = note.modified or note.created
+        if not changed:
+            return False
+        if modified_after and changed < modified_after:
+            return False
+        if modified_before and changed > modified_before:
+            return False
+        return True
+
+    return in_range
+
+
+def _find_snippets(note: Note, query_lower: str, context_lines: int) -> List[Dict[str, Any]]:
+    """
+    Find up to five matching lines in a note's content, with surrounding context.
+
+    Hits are found with str.find on note.text_lower. When lowercasing kept
+    every character's length, offsets there map straight onto the content,
+    and context lines are located with find/rfind instead of splitting the
+    whole note into lines.
+
+    Args:
+        note: Note to scan
+        query_lower: Lowercased search term
+        context_lines: Number of context lines before/after each hit
+
+    Returns:
+        List of {'line': 1-based line number, 'text': snippet} dictionaries
+    """
+    text_lower = note.text_lower
+    content = note.content
+    offset = note.content_offset
+    if len(text_lower) != offset + len(content):
+        return _find_snippets_by_lines(note, query_lower, context_lines)
+
+    snippets = []
+    line = 0
+    counted = 0
+    pos = text_lower.find(query_lower, offset)
+    while pos != -1:
+        hit = pos - offset
+        line += content.count("\n", counted, hit)
+        counted = hit
+
+        start = content.rfind("\n", 0, hit) + 1
+        for _ in range(context_lines):
+            if start == 0:
+                break
+            start = content.rfind("\n", 0, start - 1) + 1
+
+        hit_end = content.find("\n", hit)
+        end = len(content) if hit_end == -1 else hit_end
+        for _ in range(context_lines):
+            if end == len(content):
+                break
+            end = content.find("\n", end + 1)
+            if end == -1:
+                end = len(content)
+
+        snippets.append({
+            'line': line + 1,
+            'text': content[start:end].strip()
+        })
+
+        # Limit snippets per note to avoid huge responses
+        if len(snippets) >= 5 or hit_end == -1:
+            break
+
+        # One snippet per line: resume at the next line
+        pos = text_lower.find(query_lower, offset + hit_end + 1)
+
+    return snippets
+
+
+def _find_snippets_by_lines(note: Note, query_lower: str, context_lines: int) -> List[Dict[str, Any]]:
+    """
+    Find snippets by mapping hits to split content lines.
+
+    Used when lowercasing changed some character's length, so offsets in
+    note.text_lower no longer line up with the content.
+
+    Args:
+        note: Note to scan
+        query_lower: Lowercased search term
+        context_lines: Number of context lines before/after each hit
+
+    Returns:
+        List of {'line': 1-based line number, 'text': snippet} dictionaries
+    """
+    snippets = []
+    lines = note.content.split("\n")
+    line_starts = note.line_starts
+    text_lower = note.text_lower
+
+    pos = text_lower.find(query_lower, note.content_offset)
+    while pos != -1:
+        i = bisect.bisect_right(line_starts, pos) - 1
+        start = max(0, i - context_lines)
+        end = min(len(lines), i + context_lines + 1)
+        snippet_text = '\n'.join(lines[start:end])
+        snippets.append({
+            'line': i + 1,
+            'text': snippet_text.strip()
+        })
+
+        if len(snippets) >= 5 or i + 1 >= len(line_starts):
+            break
+
+        pos = text_lower.find(query_lower, line_starts[i + 1])
+
+    return snippets
+
+
+@lru_cache(maxsize=128)
+def _section_markers(section_name: str) -> Tuple[str, str]:
+    """Return the (start, end) marker strings for a daily note section."""
+    return (
+        f"<!-- SECTION:{section_name}:START -->",
+        f"<!-- SECTION:{section_name}:END -->",
+    )
+
+
+class _VaultEventHandler:
+    """Watchdog event handler that queues changed note paths for refresh()."""
+
+    # Folder events that can add or remove notes without per-file events
+    FOLDER_EVENTS = frozenset(("created", "deleted", "moved"))
+
+    # File events that don't change content
+    IGNORED_EVENTS = frozenset(("opened", "closed_no_write"))
+
+    def __init__(self, changes: queue.Queue):
+        """
+        Initialize handler.
+
+        Args:
+            changes: Queue receiving note paths, or None to request a full rescan
+        """
+        self.changes = changes
+
+    def dispatch(self, event):
+        """Queue the note paths touched by a filesystem event."""
+        if event.is_directory:
+            if event.event_type in self.FOLDER_EVENTS:
+                self.changes.put(None)
+            return
+
+        if event.event_type in self.IGNORED_EVENTS:
+            return
+
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path:
+                path = os.fsdecode(path)
+                if path.endswith(".md"):
+                    self.changes.put(path)
 
 
 class VaultIndex:
@@ -29,31 +340,484 @@ class VaultIndex:
             config: VaultConfig instance
         """
         self.config = config
+        self.excluded_folders = frozenset(config.exclude_folders)
         self.notes: Dict[str, Note] = {}  # title -> Note
-        self.notes_by_path: Dict[Path, Note] = {}  # path -> Note
+        self.notes_by_path: Dict[str, Note] = {}  # absolute path string -> Note
+        self.paths_by_title: Dict[str, Set[str]] = {}  # title key -> paths of all notes with that title
+        self.token_index: Dict[str, Set[str]] = {}  # token -> note title keys
+        self.backlinks: Dict[str, Set[str]] = {}  # linked title (lower) -> note title keys
+        self.notes_by_folder: Dict[str, Set[str]] = {}  # each ancestor folder -> note title keys
+        self.notes_by_para: Dict[str, Set[str]] = {}  # PARA location -> note title keys
+        self.notes_by_tag: Dict[str, Set[str]] = {}  # tag (lower) -> note title keys
+        # Parallel columns of title keys and created dates, oldest first; built lazily
+        # (dates are int64 microseconds, see _date_micros)
+        self._by_created: Optional[Tuple[List[str], "array[int]", int]] = None
+        # Title keys and their modified (else created) dates, oldest first; built lazily
+        self._by_modified: Optional[Tuple[List[str], "array[int]"]] = None
+        # Sorted token_index terms, for prefix range scans, and the same terms
+        # reversed, for suffix range scans; rebuilt when terms come or go
+        self._vocabulary: Optional[List[str]] = None
+        self._reversed_vocabulary: Optional[List[str]] = None
+        # (query, case_sensitive) -> sorted matching title keys; cleared on any change
+        self._search_memo: "OrderedDict[Tuple[str, bool], List[str]]" = OrderedDict()
+        self.cache = self._open_cache()
+        self._changes: Optional[queue.Queue] = None
+        self._observer = self._start_watcher()
         self._build_index()
 
+    def _start_watcher(self):
+        """Start watching the vault for changes, if enabled and available."""
+        if not self.config.watch_vault:
+            return None
+
+        if Observer is None:
+            logger.warning("watch_vault is set but watchdog is not installed; refresh will rescan the vault")
+            return None
+
+        changes = queue.Queue()
+        observer = Observer()
+        observer.daemon = True
+        try:
+            observer.schedule(_VaultEventHandler(changes), str(self.config.vault_path), recursive=True)
+            observer.start()
+        except OSError as e:
+            logger.warning(f"Could not watch vault, refresh will rescan it: {e}")
+            return None
+
+        self._changes = changes
+        return observer
+
+    def close(self):
+        """Stop the vault watcher and close the note cache."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            self._changes = None
+
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def _open_cache(self) -> Optional[NoteCache]:
+        """Open the on-disk note cache, if one is configured."""
+        cache_path = self.config.index_cache_path
+        if cache_path is None:
+            return None
+
+        try:
+            return NoteCache(cache_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Note cache disabled, could not open {cache_path}: {e}")
+            return None
+
     def _build_index(self):
         """Build index by scanning vault for markdown files."""
+        # Enumerate all .md files first, so slow parses never stall the walk
+        md_files = self._scan_markdown_files()
+
+        # Parse directory by directory for locality; this also makes the
+        # winner among notes sharing a title independent of readdir order
+        md_files.sort()
+
+        if self.cache is None:
+            for note in self._parse_files(md_files):
+                if note:
+                    self.add_note(note)
+            return
+
+        # Reuse cached notes whose file is unchanged; parse the rest
+        stats = self._stat_files(md_files)
+        cached = self._load_cache()
+        notes: Dict[str, Note] = {}
+        stale = []
+        for md_file, stat in stats.items():
+            row = cached.get(md_file)
+            note = None
+            if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+                note = NoteCache.unpickle(row[2])
+            if note is None:
+                stale.append(md_file)
+            else:
+                notes[md_file] = note
+
+        parsed = []
+        for md_file, note in zip(stale, self._parse_files(stale)):
+            if note:
+                notes[md_file] = note
+                parsed.append((note, stats[md_file]))
+
+        for md_file in md_files:
+            note = notes.get(md_file)
+            if note:
+                self.add_note(note)
+
+        self._update_cache(parsed, [path for path in cached if path not in stats])
+
+    def _parse_files(self, md_files: List[str]) -> Iterator[Optional[Note]]:
+        """
+        Parse notes, concurrently when there are enough of them.
+
+        Notes are yielded as soon as they (and every earlier file) are parsed,
+        so the caller can index them while later files are still being read.
+        Abandoning the iterator early (or an exception in the caller) cancels
+        the parses that have not started yet.
+
+        Args:
+            md_files: Absolute .md file paths
+
+        Yields:
+            Parsed notes (None for failures), in the order of md_files
+        """
         vault_path = self.config.vault_path
 
-        # Find all .md files
-        for md_file in vault_path.rglob("*.md"):
-            # Skip excluded folders
-            if is_excluded(md_file, self.config):
+        def parse(md_file: str) -> Optional[Note]:
+            return parse_note(Path(md_file), vault_path)
+
+        # Small batches (typically incremental refreshes) skip the pool
+        if len(md_files) < PARALLEL_PARSE_MIN_FILES:
+            yield from map(parse, md_files)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=MAX_IO_WORKERS)
+        try:
+            yield from executor.map(parse, md_files)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _stat_files(md_files: Iterable[str]) -> Dict[str, os.stat_result]:
+        """Stat each file, skipping any that vanished since the walk."""
+        stats = {}
+        for md_file in md_files:
+            try:
+                stats[md_file] = os.stat(md_file)
+            except OSError:
                 continue
+        return stats
 
-            # Parse note
-            note = parse_note(md_file)
-            if note:
-                self.notes[note.title.lower()] = note
-                self.notes_by_path[md_file] = note
+    def _load_cache(self) -> Dict[str, Tuple[int, int, bytes]]:
+        """Read the note cache, treating a failed read as an empty cache."""
+        try:
+            return self.cache.load()
+        except sqlite3.Error as e:
+            logger.warning(f"Ignoring unreadable note cache: {e}")
+            return {}
+
+    def _update_cache(self, parsed: List[Tuple[Note, os.stat_result]], removed: List[str]):
+        """Write parsed notes to the note cache and drop deleted files from it."""
+        if self.cache is None or (not parsed and not removed):
+            return
+
+        try:
+            self.cache.update(parsed, removed)
+        except Exception as e:
+            logger.warning(f"Failed to update note cache: {e}")
+
+    def _scan_markdown_files(self) -> List[str]:
+        """
+        Walk the vault with os.scandir, pruning excluded folders.
+
+        Excluded folders are skipped before descending, so their subtrees are
+        never read. Entry types come from readdir, avoiding extra stat calls.
+
+        Returns:
+            List of absolute .md file paths as strings
+        """
+        excluded = self.excluded_folders
+        md_files = []
+        pending = [str(self.config.vault_path)]
+
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        md_files.append(entry.path)
+
+        return md_files
+
+    def add_note(self, note: Note):
+        """
+        Add or replace a note in the index.
+
+        When a note already exists under the same title, only the postings
+        that differ between the old and new note are touched.
+
+        Args:
+            note: Parsed Note object
+        """
+        key = note.title.lower()
+        previous = self.notes.get(key)
+
+        self.notes[key] = note
+        self._track_path(str(note.path), note)
+        self._update_date_columns(key, previous, note)
+        self._search_memo.clear()
+
+        stale_terms = self._posting_terms(previous) if previous is not None else None
+        for i, (index, terms) in enumerate(self._posting_terms(note)):
+            changed = False
+            if stale_terms is not None:
+                old_terms = stale_terms[i][1]
+                changed = self._discard_postings(index, old_terms - terms, key)
+                terms = terms - old_terms
+            changed = self._add_postings(index, terms, key) or changed
+            if changed and index is self.token_index:
+                self._vocabulary = self._reversed_vocabulary = None
+
+    def _unindex_key(self, key: str):
+        """
+        Remove the note stored under a title key from the title map and postings.
+
+        Args:
+            key: Lowercased note title
+        """
+        previous = self.notes.pop(key, None)
+        if previous is None:
+            return
+
+        self._update_date_columns(key, previous, None)
+        self._search_memo.clear()
+
+        for index, terms in self._posting_terms(previous):
+            if self._discard_postings(index, terms, key) and index is self.token_index:
+                self._vocabulary = self._reversed_vocabulary = None
+
+    def _posting_terms(self, note: Note) -> Tuple[Tuple[Dict[str, Set[str]], FrozenSet[str]], ...]:
+        """Pair each posting map with the terms the note is filed under in it."""
+        return (
+            (self.token_index, note.tokens),
+            (self.backlinks, note.wikilink_set),
+            (self.notes_by_folder, self._folder_terms(note)),
+            (self.notes_by_para, self._para_terms(note)),
+            (self.notes_by_tag, self._tag_terms(note)),
+        )
+
+    @staticmethod
+    def _folder_terms(note: Note) -> FrozenSet[str]:
+        """Get every folder containing the note ("A", "A/B", ...), if its path is known."""
+        if note.rel_path is None:
+            return frozenset()
+        parts = note.rel_path.split(os.sep)[:-1]
+        return frozenset(os.sep.join(parts[:depth]) for depth in range(1, len(parts) + 1))
+
+    @staticmethod
+    def _para_terms(note: Note) -> FrozenSet[str]:
+        """Get the note's PARA location as a bucket key, if set to a string."""
+        if not note.para_location or not isinstance(note.para_location, str):
+            return frozenset()
+        return frozenset((note.para_location,))
+
+    @staticmethod
+    def _tag_terms(note: Note) -> FrozenSet[str]:
+        """Get the note's tags, lowercased, as bucket keys."""
+        return frozenset(tag.lower() for tag in note.tags)
+
+    @staticmethod
+    def _add_postings(index: Dict[str, Set[str]], terms: FrozenSet[str], key: str) -> bool:
+        """Add a title key to the posting sets of the given terms; True if a term was new."""
+        created = False
+        for term in terms:
+            postings = index.get(term)
+            if postings is None:
+                index[term] = {key}
+                created = True
+            else:
+                postings.add(key)
+        return created
+
+    @staticmethod
+    def _discard_postings(index: Dict[str, Set[str]], terms: FrozenSet[str], key: str) -> bool:
+        """Remove a title key from the posting sets of the given terms; True if a term emptied."""
+        removed = False
+        for term in terms:
+            postings = index.get(term)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del index[term]
+                    removed = True
+        return removed
 
     def refresh(self):
-        """Rebuild the index from disk."""
-        self.notes.clear()
-        self.notes_by_path.clear()
-        self._build_index()
+        """
+        Bring the index up to date with disk.
+
+        With a vault watcher running, only the paths it reported are checked;
+        otherwise this is a full_refresh().
+        """
+        if self._changes is None:
+            self.full_refresh()
+            return
+
+        paths = set()
+        rescan = False
+        while True:
+            try:
+                path = self._changes.get_nowait()
+            except queue.Empty:
+                break
+            if path is None:
+                rescan = True
+            else:
+                paths.add(path)
+
+        if rescan:
+            self.full_refresh()
+            return
+
+        # Event paths are plain strings under the watched root; check them with
+        # string operations rather than building a Path per event
+        excluded = self.excluded_folders
+        vault_root = os.path.join(str(self.config.vault_path), "")
+        notes_by_path = self.notes_by_path
+        candidates = []
+        removed = []
+        for md_file in sorted(paths):
+            if not md_file.startswith(vault_root):
+                continue
+            folders = md_file[len(vault_root):].split(os.sep)[:-1]
+            if excluded.isdisjoint(folders) and os.path.isfile(md_file):
+                candidates.append(md_file)
+            elif md_file in notes_by_path:
+                removed.append(md_file)
+
+        stats = self._stat_files(candidates)
+        changed = [
+            md_file
+            for md_file, stat in stats.items()
+            if not self._is_current(notes_by_path.get(md_file), stat)
+        ]
+        removed.extend(
+            md_file for md_file in candidates
+            if md_file not in stats and md_file in notes_by_path
+        )
+        self._apply_changes(changed, removed, stats)
+
+    @staticmethod
+    def _is_current(note: Optional[Note], stat: os.stat_result) -> bool:
+        """
+        Check whether an indexed note still matches its file.
+
+        The size is compared as well as the mtime, since filesystems with
+        coarse timestamps can miss an edit made within the same tick.
+
+        Args:
+            note: Indexed note for the file, if any
+            stat: Current stat of the file
+
+        Returns:
+            True if the note can be kept without re-parsing
+        """
+        return (
+            note is not None
+            and note.mtime_ns == stat.st_mtime_ns
+            and note.size == stat.st_size
+        )
+
+    def apply_pending_changes(self):
+        """
+        Apply changes reported by the vault watcher, if any are queued.
+
+        This is cheap when nothing changed, so readers call it before each
+        query. Without a watcher it does nothing; refresh() rescans instead.
+        """
+        if self._changes is not None and not self._changes.empty():
+            self.refresh()
+
+    def full_refresh(self):
+        """
+        Bring the index up to date by walking the whole vault.
+
+        Only files that are new or whose mtime or size changed are re-parsed; notes
+        whose files disappeared are dropped. The resulting index matches a
+        full rebuild.
+        """
+        # The walk covers every event the watcher has queued so far
+        if self._changes is not None:
+            while True:
+                try:
+                    self._changes.get_nowait()
+                except queue.Empty:
+                    break
+
+        stats = self._stat_files(self._scan_markdown_files())
+        notes_by_path = self.notes_by_path
+
+        removed = [md_file for md_file in notes_by_path if md_file not in stats]
+        changed = sorted(
+            md_file
+            for md_file, stat in stats.items()
+            if not self._is_current(notes_by_path.get(md_file), stat)
+        )
+        self._apply_changes(changed, removed, stats)
+
+    def _apply_changes(
+        self,
+        changed: List[str],
+        removed: List[str],
+        stats: Dict[str, os.stat_result],
+    ):
+        """
+        Re-parse changed files and drop removed ones from every index map.
+
+        Args:
+            changed: Sorted paths of new or modified note files
+            removed: Paths of indexed notes whose files are gone
+            stats: Stat results for (at least) the changed files
+        """
+        if not removed and not changed:
+            return
+
+        affected = set()
+        for md_file in removed:
+            previous = self._untrack_path(md_file)
+            if previous is not None:
+                affected.add(previous.title.lower())
+
+        parsed = []
+        for md_file, note in zip(changed, self._parse_files(changed)):
+            previous = self._untrack_path(md_file)
+            if previous is not None:
+                affected.add(previous.title.lower())
+            if note:
+                self._track_path(md_file, note)
+                affected.add(note.title.lower())
+                parsed.append((note, stats[md_file]))
+        self._update_cache(parsed, removed)
+
+        # Re-sorting once beats many single inserts into the date columns
+        if len(affected) > len(self.notes) // 16:
+            self._by_created = None
+            self._by_modified = None
+
+        # Among notes sharing a title, a full rebuild keeps the last path in
+        # sorted order; re-pick that winner for every title that changed
+        for key in sorted(affected):
+            self._unindex_key(key)
+            paths = self.paths_by_title.get(key)
+            if paths:
+                self.add_note(self.notes_by_path[max(paths)])
+
+    def _track_path(self, md_file: str, note: Note):
+        """Record the note parsed from a file in notes_by_path and paths_by_title."""
+        self.notes_by_path[md_file] = note
+        self.paths_by_title.setdefault(note.title.lower(), set()).add(md_file)
+
+    def _untrack_path(self, md_file: str) -> Optional[Note]:
+        """Forget the note parsed from a file; returns it, if there was one."""
+        note = self.notes_by_path.pop(md_file, None)
+        if note is not None:
+            self._discard_postings(self.paths_by_title, frozenset((note.title.lower(),)), md_file)
+        return note
 
     def get_note_by_title(self, title: str) -> Optional[Note]:
         """
@@ -67,21 +831,23 @@ class VaultIndex:
         """
         return self.notes.get(title.lower())
 
-    def get_note_by_path(self, path: Path) -> Optional[Note]:
+    def get_note_by_path(self, path: Union[str, Path]) -> Optional[Note]:
         """
         Get note by file path.
 
         Args:
-            path: Absolute or relative path to note
+            path: Absolute or vault-relative path to note
 
         Returns:
             Note object or None
         """
+        key = os.fspath(path)
+
         # Convert to absolute path
-        if not path.is_absolute():
-            path = self.config.vault_path / path
+        if not os.path.isabs(key):
+            key = os.path.join(self.config.vault_path, key)
 
-        return self.notes_by_path.get(path)
+        return self.notes_by_path.get(os.path.normpath(key))
 
     def search_content(
         self,
@@ -105,28 +871,310 @@ class VaultIndex:
             List of matching notes
         """
         results = []
+        para_keys = self._para_keys(para_location)
+        folder_keys = self._folder_keys(folder)
 
-        for note in self.notes.values():
-            # Apply filters
-            if para_location and note.para_location != para_location:
+        for key in self._matching_keys(query, case_sensitive):
+            if para_keys is not None and key not in para_keys:
                 continue
 
-            if folder:
-                try:
-                    rel_path = note.path.relative_to(self.config.vault_path)
-                    if not str(rel_path).startswith(folder):
-                        continue
-                except ValueError:
+            if folder_keys is not None and key not in folder_keys:
+                continue
+
+            results.append(self.notes[key])
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def _matching_keys(self, query: str, case_sensitive: bool) -> List[str]:
+        """
+        Find title keys of all notes containing the query, memoized.
+
+        Repeated queries (paging, re-filtering) reuse the match list until
+        the index next changes.
+
+        Args:
+            query: Search term
+            case_sensitive: Whether to match case
+
+        Returns:
+            Sorted title keys of notes for which contains_text is true
+        """
+        needle = query if case_sensitive else query.lower()
+        memo_key = (needle, case_sensitive)
+
+        keys = self._search_memo.get(memo_key)
+        if keys is not None:
+            self._search_memo.move_to_end(memo_key)
+            return keys
+
+        # Narrow to notes whose tokens can contain the query, then verify
+        # (same test as Note.contains_text)
+        candidates = self._candidate_keys(query)
+        notes = self.notes
+        if case_sensitive:
+            keys = [key for key in sorted(candidates if candidates is not None else notes)
+                    if notes[key].contains_exact(needle)]
+        else:
+            keys = [key for key in sorted(candidates if candidates is not None else notes)
+                    if needle in notes[key].text_lower]
+
+        self._search_memo[memo_key] = keys
+        if len(self._search_memo) > SEARCH_MEMO_SIZE:
+            self._search_memo.popitem(last=False)
+        return keys
+
+    def _select_notes(self, *key_sets: Optional[Set[str]]) -> Iterable[Note]:
+        """
+        Resolve the intersection of candidate key sets to notes.
+
+        Args:
+            key_sets: Candidate title key sets; None means unconstrained
+
+        Returns:
+            Matching notes in title order, or all notes if nothing constrains
+        """
+        keys = self._intersect_keys(*key_sets)
+        if keys is None:
+            return self.notes.values()
+
+        return [self.notes[key] for key in sorted(keys)]
+
+    @staticmethod
+    def _intersect_keys(*key_sets: Optional[Set[str]]) -> Optional[Set[str]]:
+        """Intersect candidate key sets, ignoring None; None if all are None."""
+        keys: Optional[Set[str]] = None
+        for key_set in key_sets:
+            if key_set is None:
+                continue
+            keys = set(key_set) if keys is None else keys & key_set
+        return keys
+
+    def _created_columns(self) -> Tuple[List[str], "array[int]", int]:
+        """
+        Get all title keys with their creation dates, in ascending date order.
+
+        Dates are packed int64 microseconds (_date_micros), so the column is
+        one contiguous buffer rather than a list of datetime objects. Undated
+        notes sort first (as datetime.min, i.e. 0); equal dates are in
+        descending title key order, so walking backwards yields newest first
+        with ties in title key order. The columns are built on first use and
+        then kept in order as notes are added and removed.
+
+        Returns:
+            Tuple of (title keys, created dates, number of undated notes)
+        """
+        if self._by_created is None:
+            # Partition first: undated notes only need ordering by key, and
+            # only dated ones go through the date sort
+            micros = {}
+            undated_keys = []
+            for key, note in self.notes.items():
+                if note.created and (date := _date_micros(note.created)):
+                    micros[key] = date
+                else:
+                    undated_keys.append(key)
+
+            undated_keys.sort(reverse=True)
+            dated_keys = sorted(micros, reverse=True)
+            dated_keys.sort(key=micros.__getitem__)
+
+            created = array("q", bytes(8 * len(undated_keys)))
+            created.extend(map(micros.__getitem__, dated_keys))
+            self._by_created = (undated_keys + dated_keys, created, len(undated_keys))
+        return self._by_created
+
+    @staticmethod
+    def _created_position(keys: List[str], created: "array[int]", date: int, key: str) -> int:
+        """Find where a key belongs in the created columns (or where it already is)."""
+        lo = bisect.bisect_left(created, date)
+        hi = bisect.bisect_right(created, date, lo)
+        # Keys sharing a date are in descending order
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[mid] > key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _update_date_columns(self, key: str, old: Optional[Note], new: Optional[Note]):
+        """
+        Move a title key within the built date columns as its note changes.
+
+        Columns that have not been built yet are left for their first use.
+
+        Args:
+            key: Lowercased note title
+            old: Note previously indexed under the key, if any
+            new: Note now indexed under the key, if any
+        """
+        if self._by_created is not None:
+            keys, created, undated = self._by_created
+            for note, insert in ((old, False), (new, True)):
+                if note is None:
                     continue
+                date = _date_micros(note.created_sort_key)
+                i = self._created_position(keys, created, date, key)
+                if insert:
+                    keys.insert(i, key)
+                    created.insert(i, date)
+                else:
+                    del keys[i]
+                    del created[i]
+                if date == 0:
+                    undated += 1 if insert else -1
+            self._by_created = (keys, created, undated)
+
+        if self._by_modified is not None:
+            keys, changed = self._by_modified
+            if old is not None and (old.modified or old.created):
+                i = bisect.bisect_left(changed, _date_micros(old.modified or old.created))
+                while keys[i] != key:
+                    i += 1
+                del keys[i]
+                del changed[i]
+            if new is not None and (new.modified or new.created):
+                date = _date_micros(new.modified or new.created)
+                i = bisect.bisect_right(changed, date)
+                keys.insert(i, key)
+                changed.insert(i, date)
+
+    def _modified_columns(self) -> Tuple[List[str], "array[int]"]:
+        """
+        Get title keys with their modification dates, in ascending date order.
 
-            # Check content
-            if note.contains_text(query, case_sensitive):
-                results.append(note)
+        The date is the file modification time, falling back to the creation
+        date; notes with neither are left out, as no modified filter matches
+        them. The columns are built on first use and then kept in order as
+        notes are added and removed.
 
-                if len(results) >= limit:
-                    break
+        Returns:
+            Tuple of (title keys, modification dates as int64 microseconds)
+        """
+        if self._by_modified is None:
+            dated = [
+                (_date_micros(note.modified or note.created), key)
+                for key, note in self.notes.items()
+                if note.modified or note.created
+            ]
+            dated.sort(key=itemgetter(0))
+            self._by_modified = (
+                [key for _, key in dated],
+                array("q", [changed for changed, _ in dated]),
+            )
+        return self._by_modified
 
-        return results
+    def _modified_span(
+        self,
+        modified_after: Optional[datetime],
+        modified_before: Optional[datetime],
+    ) -> Tuple[int, int]:
+        """Get the slice of the modified columns within the range, by bisecting the dates."""
+        _, changed = self._modified_columns()
+        start = bisect.bisect_left(changed, _date_micros(modified_after)) if modified_after else 0
+        stop = (bisect.bisect_right(changed, _date_micros(modified_before))
+                if modified_before else len(changed))
+        return start, stop
+
+    def _para_keys(self, para_location: Optional[str]) -> Optional[Set[str]]:
+        """Get title keys of notes in a PARA location, or None when not filtering."""
+        if not para_location:
+            return None
+        return self.notes_by_para.get(para_location, set())
+
+    def _folder_keys(self, folder: Optional[str]) -> Optional[Set[str]]:
+        """Get title keys of notes anywhere under a folder, or None when not filtering."""
+        folder = _normalize_folder(folder)
+        if not folder:
+            return None
+        return self.notes_by_folder.get(folder, set())
+
+    def _candidate_keys(self, query: str) -> Optional[Set[str]]:
+        """
+        Find title keys of notes that may contain the query, via the token index.
+
+        Tokens inside the query must match whole note tokens. The first and
+        last query tokens may continue outside the query, so they match as
+        suffix/prefix (or substring, for a single-token query) against the
+        indexed vocabulary. Candidates still need verifying with contains_text.
+
+        Args:
+            query: Search term
+
+        Returns:
+            Set of candidate title keys, or None if the query has no tokens
+        """
+        query_lower = query.lower()
+        matches = list(TOKEN_PATTERN.finditer(query_lower))
+        if not matches:
+            return None
+
+        # Check exact (bounded) tokens first; they are cheapest and most selective
+        matches.sort(key=lambda m: m.start() == 0 or m.end() == len(query_lower))
+
+        candidates: Optional[Set[str]] = None
+        for match in matches:
+            token = match.group()
+            open_left = match.start() == 0
+            open_right = match.end() == len(query_lower)
+
+            if open_left and open_right:
+                terms = [t for t in self.token_index if token in t]
+            elif open_left:
+                terms = self._suffix_terms(token)
+            elif open_right:
+                terms = self._prefix_terms(token)
+            else:
+                terms = [token] if token in self.token_index else []
+
+            postings: Set[str] = set()
+            for term in terms:
+                postings.update(self.token_index[term])
+
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return set()
+
+        return candidates
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """
+        Get the indexed tokens starting with a prefix, by bisecting the sorted vocabulary.
+
+        Args:
+            prefix: Lowercase token prefix
+
+        Returns:
+            Matching tokens from token_index
+        """
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.token_index)
+        return self._bisect_prefix(self._vocabulary, prefix)
+
+    def _suffix_terms(self, suffix: str) -> List[str]:
+        """
+        Get the indexed tokens ending with a suffix, by bisecting the reversed vocabulary.
+
+        Args:
+            suffix: Lowercase token suffix
+
+        Returns:
+            Matching tokens from token_index
+        """
+        if self._reversed_vocabulary is None:
+            self._reversed_vocabulary = sorted(term[::-1] for term in self.token_index)
+        return [term[::-1] for term in self._bisect_prefix(self._reversed_vocabulary, suffix[::-1])]
+
+    @staticmethod
+    def _bisect_prefix(vocabulary: List[str], prefix: str) -> List[str]:
+        """Get the run of a sorted term list that starts with prefix."""
+        start = bisect.bisect_left(vocabulary, prefix)
+        return list(itertools.takewhile(
+            lambda term: term.startswith(prefix),
+            itertools.islice(vocabulary, start, None),
+        ))
 
     def list_notes(
         self,
@@ -135,10 +1183,12 @@ class VaultIndex:
         tags: Optional[List[str]] = None,
         created_after: Optional[datetime] = None,
         created_before: Optional[datetime] = None,
+        modified_after: Optional[datetime] = None,
+        modified_before: Optional[datetime] = None,
         limit: int = 50,
     ) -> List[Note]:
         """
-        List notes matching criteria.
+        List notes matching criteria, newest first.
 
         Args:
             para_location: Filter by PARA location
@@ -146,40 +1196,69 @@ class VaultIndex:
             tags: Filter by tags (AND logic)
             created_after: Minimum creation date
             created_before: Maximum creation date
+            modified_after: Minimum modification date (falls back to creation date)
+            modified_before: Maximum modification date (falls back to creation date)
             limit: Maximum results
 
         Returns:
             List of matching notes
         """
-        results = []
-
-        for note in self.notes.values():
-            # Folder filter
-            if folder:
-                try:
-                    rel_path = note.path.relative_to(self.config.vault_path)
-                    if not str(rel_path).startswith(folder):
-                        continue
-                except ValueError:
-                    continue
-
-            # Other filters via Note.matches_criteria
-            if note.matches_criteria(
-                para_location=para_location,
-                tags=tags,
-                created_after=created_after,
-                created_before=created_before,
-            ):
-                results.append(note)
+        # A selective modified range narrows the candidates up front; a wide
+        # one is cheaper to test on just the notes the walk visits
+        modified_keys = None
+        in_modified_range = None
+        if modified_after or modified_before:
+            start, stop = self._modified_span(modified_after, modified_before)
+            if stop - start < len(self.notes) // 4:
+                modified_keys = set(self._modified_columns()[0][start:stop])
+            else:
+                in_modified_range = _compile_modified_filter(modified_after, modified_before)
+
+        # PARA location, folder and tags are settled exactly by their buckets
+        keys = self._intersect_keys(
+            self._para_keys(para_location),
+            self._folder_keys(folder),
+            *(self.notes_by_tag.get(tag.lower(), set()) for tag in tags or ()),
+            modified_keys,
+        )
 
-                if len(results) >= limit:
-                    break
+        if keys is not None and len(keys) < len(self.notes) // 4:
+            # Few candidates: select the newest without sorting every match
+            in_created_range = _compile_created_filter(created_after, created_before)
+            results = self._select_notes(keys)
+            for in_range in (in_created_range, in_modified_range):
+                if in_range is not None:
+                    results = [note for note in results if in_range(note)]
+            return heapq.nlargest(
+                limit,
+                results,
+                key=attrgetter("created_sort_key"),
+            )
 
-        # Sort by creation date (newest first)
-        results.sort(
-            key=lambda n: n.created if n.created else datetime.min,
-            reverse=True
-        )
+        # Walk the index newest first and stop once enough notes match.
+        # Dated notes outside the created range are skipped by bisecting the
+        # date column; undated notes pass date filters and come last.
+        results = []
+        if limit <= 0:
+            return results
+
+        ordered_keys, created, undated = self._created_columns()
+        start = (bisect.bisect_left(created, _date_micros(created_after), lo=undated)
+                 if created_after else undated)
+        stop = (bisect.bisect_right(created, _date_micros(created_before), lo=undated)
+                if created_before else len(created))
+        window = itertools.chain(range(stop - 1, start - 1, -1), range(undated - 1, -1, -1))
+
+        for i in window:
+            key = ordered_keys[i]
+            if keys is not None and key not in keys:
+                continue
+            note = self.notes[key]
+            if in_modified_range is not None and not in_modified_range(note):
+                continue
+            results.append(note)
+            if len(results) >= limit:
+                break
 
         return results
 
@@ -188,19 +1267,13 @@ class VaultIndex:
         Find all notes that link to the specified note.
 
         Args:
-            note_title: Title of target note
+            note_title: Title of target note (case-insensitive)
 
         Returns:
             List of notes containing links to target
         """
-        backlinks = []
-
-        for note in self.notes.values():
-            links = note.get_wikilinks()
-            if note_title in links:
-                backlinks.append(note)
-
-        return backlinks
+        keys = self.backlinks.get(note_title.lower(), ())
+        return [self.notes[key] for key in sorted(keys)]
 
 
 class VaultReader:
@@ -239,15 +1312,13 @@ class VaultReader:
         if not path and not title:
             raise ValueError("Must provide either path or title")
 
+        self.index.apply_pending_changes()
+
         note = None
 
         if path:
-            # Try as absolute path
-            file_path = Path(path)
-            if not file_path.is_absolute():
-                file_path = self.config.vault_path / path
-
-            note = self.index.get_note_by_path(file_path)
+            # Absolute or vault-relative path
+            note = self.index.get_note_by_path(path)
 
         if not note and title:
             note = self.index.get_note_by_title(title)
@@ -286,6 +1357,7 @@ class VaultReader:
         Returns:
             List of note dictionaries
         """
+        self.index.apply_pending_changes()
         notes = self.index.search_content(
             query=query,
             para_location=para_location,
@@ -293,31 +1365,17 @@ class VaultReader:
             limit=min(limit, self.config.max_search_results),
         )
 
+        # Snippets are found in each note's cached lowercase text, so only
+        # the query needs lowercasing, once
+        query_lower = query.lower()
+
         results = []
         for note in notes:
             result = note.to_dict(include_content=False)
 
             if include_snippets:
                 # Extract matching snippets with context
-                snippets = []
-                lines = note.content.split('\n')
-                query_lower = query.lower()
-
-                for i, line in enumerate(lines):
-                    if query_lower in line.lower():
-                        start = max(0, i - context_lines)
-                        end = min(len(lines), i + context_lines + 1)
-                        snippet_text = '\n'.join(lines[start:end])
-                        snippets.append({
-                            'line': i + 1,
-                            'text': snippet_text.strip()
-                        })
-
-                        # Limit snippets per note to avoid huge responses
-                        if len(snippets) >= 5:
-                            break
-
-                result['snippets'] = snippets
+                result['snippets'] = _find_snippets(note, query_lower, context_lines)
 
             results.append(result)
 
@@ -350,6 +1408,7 @@ class VaultReader:
         Returns:
             List of note dictionaries
         """
+        self.index.apply_pending_changes()
         # Parse creation dates
         after_dt = None
         before_dt = None
@@ -388,30 +1447,11 @@ class VaultReader:
             tags=tags,
             created_after=after_dt,
             created_before=before_dt,
-            limit=min(limit, self.config.max_search_results) * 3,  # Get more for filtering
+            modified_after=mod_after_dt,
+            modified_before=mod_before_dt,
+            limit=min(limit, self.config.max_search_results),
         )
 
-        # Apply modification date filters if specified
-        if mod_after_dt or mod_before_dt:
-            filtered_notes = []
-            for note in notes:
-                if note.modified:
-                    if mod_after_dt and note.modified < mod_after_dt:
-                        continue
-                    if mod_before_dt and note.modified > mod_before_dt:
-                        continue
-                    filtered_notes.append(note)
-                elif note.created:
-                    # Fall back to created date if modified not available
-                    if mod_after_dt and note.created < mod_after_dt:
-                        continue
-                    if mod_before_dt and note.created > mod_before_dt:
-                        continue
-                    filtered_notes.append(note)
-            notes = filtered_notes[:limit]
-        else:
-            notes = notes[:limit]
-
         return [note.to_dict(include_content=False) for note in notes]
 
     def get_backlinks(self, note_title: str) -> List[Dict[str, Any]]:
@@ -424,6 +1464,7 @@ class VaultReader:
         Returns:
             List of note dictionaries
         """
+        self.index.apply_pending_changes()
         notes = self.index.get_backlinks(note_title)
         return [note.to_dict(include_content=False) for note in notes]
 
@@ -437,7 +1478,8 @@ class VaultReader:
         Returns:
             Note dictionary or None
         """
-        target_path = resolve_wikilink(link, self.config.vault_path)
+        self.index.apply_pending_changes()
+        target_path = resolve_wikilink(link, self.config.vault_path, self.index.excluded_folders)
 
         if not target_path:
             return None
@@ -450,8 +1492,13 @@ class VaultReader:
         return note.to_dict(include_content=False)
 
     def refresh_index(self):
-        """Rebuild the note index from disk."""
-        self.index.refresh()
+        """
+        Re-sync the note index with disk, re-parsing only changed notes.
+
+        Always walks the whole vault, even with a watcher running, so changes
+        the watcher missed are picked up too.
+        """
+        self.index.full_refresh()
 
     def _write_note_atomic(
         self,
@@ -485,15 +1532,43 @@ class VaultReader:
         note_content = frontmatter.dumps(post)
 
         # Write atomically: temp file -> rename
+        self._replace_file_atomic(file_path, note_content)
+
+        # Index from the rendered text instead of reading the file back
+        self.index.add_note(Note(file_path, note_content, self.config.vault_path))
+
+        return file_path
+
+    def _replace_file_atomic(self, file_path: Path, text: str):
+        """
+        Write text to a file atomically (write to temp, fsync, then rename).
+
+        The temp file lives in the target directory, so the rename is a single
+        same-filesystem os.replace. The parent directory is fsynced afterwards
+        so the rename itself survives a crash.
+
+        Args:
+            file_path: Target file path
+            text: Full file content
+
+        Raises:
+            OSError: If write fails
+        """
+        # Encode once and hand the bytes straight to the OS, no buffered layer
+        data = memoryview(text.encode("utf-8"))
+
         temp_fd, temp_path = tempfile.mkstemp(
             suffix=".md",
             dir=file_path.parent,
-            text=True
         )
         try:
-            with open(temp_fd, "w", encoding="utf-8") as f:
-                f.write(note_content)
-            shutil.move(temp_path, file_path)
+            try:
+                while data:
+                    data = data[os.write(temp_fd, data):]
+                os.fsync(temp_fd)
+            finally:
+                os.close(temp_fd)
+            os.replace(temp_path, file_path)
         except Exception:
             # Clean up temp file on failure
             try:
@@ -502,13 +1577,17 @@ class VaultReader:
                 pass
             raise
 
-        # Add to index
-        note = parse_note(file_path)
-        if note:
-            self.index.notes[note.title.lower()] = note
-            self.index.notes_by_path[file_path] = note
-
-        return file_path
+        # Persist the directory entry; not supported on every platform
+        try:
+            dir_fd = os.open(file_path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
 
     def create_daily_note(
         self,
@@ -581,37 +1660,85 @@ class VaultReader:
         Returns:
             Dictionary with note info
         """
-        # Read existing content
-        with open(file_path, "r", encoding="utf-8") as f:
-            existing_content = f.read()
-
-        # Parse to preserve frontmatter
-        parsed = frontmatter.loads(existing_content)
+        # Reuse the indexed note if the file hasn't changed since it was parsed
+        self.index.apply_pending_changes()
+        cached = self.index.get_note_by_path(file_path)
+        if cached is not None and not VaultIndex._is_current(cached, file_path.stat()):
+            cached = None
+
+        if cached is not None:
+            parsed = frontmatter.Post(cached.content)
+            parsed.metadata.update(cached.metadata)
+        else:
+            # Parse to preserve frontmatter
+            parsed = frontmatter.loads(file_path.read_text(encoding="utf-8"))
 
         # Append new content with separator
         separator = "\n\n---\n\n"
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        timestamp = _format_now("%Y-%m-%d %H:%M")
         new_section = f"## Added {timestamp}\n\n{content}"
-        parsed.content = parsed.content.rstrip() + separator + new_section
-
-        # Write back
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(parsed))
+        body = parsed.content
+        parsed.content = body.rstrip() + separator + new_section
+
+        # Frontmatter is unchanged, so an indexed note with a body can simply
+        # have the new section written at its end; otherwise write back
+        appended = (
+            cached is not None
+            and bool(body.strip())
+            and self._append_in_place(file_path, separator + new_section)
+        )
+        if not appended:
+            note_content = frontmatter.dumps(parsed)
+            with open(file_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(note_content)
 
-        # Refresh this note in index
-        note = parse_note(file_path)
-        if note:
-            self.index.notes[note.title.lower()] = note
-            self.index.notes_by_path[file_path] = note
+        # Refresh this note in index without reading it back
+        if cached is not None:
+            # frontmatter strips the body on load; match what a re-read would see
+            note = cached.with_content(parsed.content.strip())
+        else:
+            note = Note(file_path, note_content, self.config.vault_path)
+        self.index.add_note(note)
 
         return {
             "success": True,
             "path": str(file_path),
             "title": file_path.stem,
-            "para_location": note.para_location if note else None,
+            "para_location": note.para_location,
             "action": "appended",
         }
 
+    @staticmethod
+    def _append_in_place(file_path: Path, text: str) -> bool:
+        """
+        Write text at the end of a file, replacing its trailing whitespace.
+
+        Only the last APPEND_TAIL_SIZE bytes are read, so the cost does not
+        grow with the note.
+
+        Args:
+            file_path: Path to the file
+            text: Text to append
+
+        Returns:
+            True if appended, False if the read tail is all whitespace (the
+            caller should rewrite the file instead)
+        """
+        with open(file_path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - APPEND_TAIL_SIZE))
+            # A character split at the start of the tail is dropped; it is
+            # never part of the trailing whitespace being measured
+            tail = f.read().decode("utf-8", errors="ignore")
+            kept = tail.rstrip()
+            if not kept:
+                return False
+
+            f.seek(size - len(tail[len(kept):].encode("utf-8")))
+            f.truncate()
+            f.write(text.encode("utf-8"))
+        return True
+
     def create_inbox_note(
         self,
         title: str,
@@ -645,7 +1772,7 @@ class VaultReader:
 
         # Build metadata
         metadata = {
-            "created": datetime.now().strftime("%Y-%m-%d"),
+            "created": _format_now("%Y-%m-%d"),
             "para": "inbox",
         }
         if tags:
@@ -731,7 +1858,7 @@ class VaultReader:
 
         # Build metadata
         metadata = {
-            "created": datetime.now().strftime("%Y-%m-%d"),
+            "created": _format_now("%Y-%m-%d"),
             "para": para_location,
         }
         if tags:
@@ -763,13 +1890,9 @@ class VaultReader:
         Returns:
             Sanitized filename-safe string
         """
-        # Remove or replace problematic characters
-        # Keep alphanumeric, spaces, hyphens, underscores
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
-        sanitized = sanitized.strip()
-
-        # Collapse multiple spaces
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        # Remove problematic characters and collapse whitespace runs
+        sanitized = title.translate(_FILENAME_UNSAFE_CHARS)
+        sanitized = _WHITESPACE_RE.sub(' ', sanitized).strip()
 
         # Limit length (leave room for .md extension)
         max_length = 200
@@ -827,12 +1950,16 @@ class VaultReader:
         else:
             attachment_name = filename
             file_extension = Path(filename).suffix.lstrip('.').lower()
-            # Decode to check size
-            try:
-                decoded = base64.b64decode(base64_content)
-                file_size = len(decoded)
-            except Exception as e:
-                raise ValueError(f"Invalid base64 content: {e}")
+            # Validate and size the payload without decoding it into memory
+            encoded = base64_content.strip()
+            if not _BASE64_RE.fullmatch(encoded):
+                encoded = "".join(encoded.split())
+                if not _BASE64_RE.fullmatch(encoded):
+                    raise ValueError(
+                        "Invalid base64 content: expected standard base64 "
+                        "characters padded to a multiple of 4"
+                    )
+            file_size = len(encoded) // 4 * 3 - encoded[-2:].count("=")
 
         # Validate file type
         if file_extension not in self.config.supported_attachment_types:
@@ -861,10 +1988,12 @@ class VaultReader:
         # Copy or write file
         try:
             if source_path:
-                shutil.copy2(source, target_path)
+                shutil.copyfile(source, target_path)
             else:
-                with open(target_path, 'wb') as f:
-                    f.write(decoded)
+                # Decode in bounded chunks straight to disk
+                with open(target_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    for start in range(0, len(encoded), BASE64_CHUNK_SIZE):
+                        f.write(binascii.a2b_base64(encoded[start:start + BASE64_CHUNK_SIZE]))
 
             logger.info(f"Added attachment: {target_path}")
 
@@ -929,14 +2058,12 @@ class VaultReader:
             ValueError: If note not found
         """
         # Find the note
+        self.index.apply_pending_changes()
         note = None
 
         # Try as path first
         if '/' in note_ref or note_ref.endswith('.md'):
-            path = Path(note_ref)
-            if not path.is_absolute():
-                path = self.config.vault_path / note_ref
-            note = self.index.get_note_by_path(path)
+            note = self.index.get_note_by_path(note_ref)
 
         # Try as title
         if not note:
@@ -947,8 +2074,7 @@ class VaultReader:
 
         # Read current content
         file_path = note.path
-        with open(file_path, "r", encoding="utf-8") as f:
-            existing_content = f.read()
+        existing_content = file_path.read_text(encoding="utf-8")
 
         # Parse to preserve frontmatter
         parsed = frontmatter.loads(existing_content)
@@ -963,27 +2089,12 @@ class VaultReader:
         parsed.content = parsed.content.rstrip() + append_content
 
         # Write back atomically
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix=".md",
-            dir=file_path.parent,
-            text=True
-        )
-        try:
-            with open(temp_fd, "w", encoding="utf-8") as f:
-                f.write(frontmatter.dumps(parsed))
-            shutil.move(temp_path, file_path)
-        except Exception:
-            try:
-                Path(temp_path).unlink()
-            except OSError:
-                pass
-            raise
+        self._replace_file_atomic(file_path, frontmatter.dumps(parsed))
 
         # Refresh note in index
-        refreshed = parse_note(file_path)
+        refreshed = parse_note(file_path, self.config.vault_path)
         if refreshed:
-            self.index.notes[refreshed.title.lower()] = refreshed
-            self.index.notes_by_path[file_path] = refreshed
+            self.index.add_note(refreshed)
 
         return {
             "note_title": note.title,
@@ -1012,6 +2123,7 @@ class VaultReader:
         Returns:
             List of dicts with note info, sorted by date (oldest first)
         """
+        self.index.apply_pending_changes()
         journal_folder = self.config.vault_path / self.config.daily_journal_folder
 
         if not journal_folder.exists():
@@ -1024,53 +2136,77 @@ class VaultReader:
         date_regex = date_format.replace("%Y", r"\d{4}").replace("%m", r"\d{2}").replace("%d", r"\d{2}")
         date_pattern = re.compile(rf"^{date_regex}\.md$")
 
-        # Use glob (not rglob) to only get files directly in the folder
-        unarchived = []
+        # Scan only the folder itself (not subfolders) for date-named notes
+        candidates = []
 
-        for note_path in journal_folder.glob("*.md"):
-            # Check if filename matches date pattern
-            if not date_pattern.match(note_path.name):
-                continue
+        with os.scandir(journal_folder) as entries:
+            for entry in entries:
+                # Check if filename matches date pattern
+                if not entry.is_file() or not date_pattern.match(entry.name):
+                    continue
 
-            # Extract date from filename
-            date_str = note_path.stem
+                # Exclude specified date (typically today)
+                date_str = entry.name[:-len(".md")]
+                if exclude_date and date_str == exclude_date:
+                    continue
 
-            # Exclude specified date (typically today)
-            if exclude_date and date_str == exclude_date:
-                continue
+                candidates.append(Path(entry.path))
 
-            # Parse the note for metadata
-            try:
-                with open(note_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+        # Read and parse the notes concurrently; reads are I/O bound
+        if len(candidates) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as executor:
+                unarchived = list(executor.map(self._summarize_daily_note, candidates))
+        else:
+            unarchived = [self._summarize_daily_note(p) for p in candidates]
 
-                parsed = frontmatter.loads(content)
+        # Sort by date (oldest first)
+        unarchived.sort(key=itemgetter("date"))
 
-                unarchived.append({
-                    "path": str(note_path),
-                    "date": date_str,
-                    "filename": note_path.name,
-                    "frontmatter": dict(parsed.metadata),
-                    "content_length": len(parsed.content),
-                    "has_section_markers": "<!-- SECTION:" in content,
-                })
-            except Exception as e:
-                logger.warning(f"Could not parse {note_path}: {e}")
-                unarchived.append({
+        logger.info(f"Found {len(unarchived)} unarchived daily note(s)")
+        return unarchived
+
+    def _summarize_daily_note(self, note_path: Path) -> Dict[str, Any]:
+        """Read a daily note and summarize its metadata for archive detection."""
+        date_str = note_path.stem
+
+        try:
+            # The indexed note already holds the parsed frontmatter and body;
+            # notes without frontmatter are re-read so parse errors still surface.
+            # Both branches look for section markers in the body only
+            note = self.index.get_note_by_path(note_path)
+            if note is not None and note.metadata and VaultIndex._is_current(note, note_path.stat()):
+                return {
                     "path": str(note_path),
                     "date": date_str,
                     "filename": note_path.name,
-                    "frontmatter": {},
-                    "content_length": 0,
-                    "has_section_markers": False,
-                    "error": str(e),
-                })
+                    "frontmatter": dict(note.metadata),
+                    "content_length": len(note.content),
+                    "has_section_markers": "<!-- SECTION:" in note.content,
+                }
 
-        # Sort by date (oldest first)
-        unarchived.sort(key=lambda x: x["date"])
+            content = note_path.read_text(encoding="utf-8")
 
-        logger.info(f"Found {len(unarchived)} unarchived daily note(s)")
-        return unarchived
+            parsed = frontmatter.loads(content)
+
+            return {
+                "path": str(note_path),
+                "date": date_str,
+                "filename": note_path.name,
+                "frontmatter": dict(parsed.metadata),
+                "content_length": len(parsed.content),
+                "has_section_markers": "<!-- SECTION:" in parsed.content,
+            }
+        except Exception as e:
+            logger.warning(f"Could not parse {note_path}: {e}")
+            return {
+                "path": str(note_path),
+                "date": date_str,
+                "filename": note_path.name,
+                "frontmatter": {},
+                "content_length": 0,
+                "has_section_markers": False,
+                "error": str(e),
+            }
 
     def extract_note_tasks(
         self,
@@ -1099,8 +2235,7 @@ class VaultReader:
         if not path.exists():
             raise FileNotFoundError(f"Note not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = path.read_text(encoding="utf-8")
 
         # Parse frontmatter
         parsed = frontmatter.loads(content)
@@ -1119,21 +2254,21 @@ class VaultReader:
         def parse_task_line(line: str, section_name: str) -> Optional[Dict[str, Any]]:
             """Parse a single task line and return task dict."""
             # Match: - [x] or - [ ] followed by task text
-            checked_match = re.match(r'^-\s*\[x\]\s+(.+?)(?:\s*✅\s*(\d{4}-\d{2}-\d{2}))?$', line, re.IGNORECASE)
-            unchecked_match = re.match(r'^-\s*\[ \]\s+(.+)$', line)
+            checked_match = _CHECKED_TASK_RE.match(line)
+            unchecked_match = None if checked_match else _UNCHECKED_TASK_RE.match(line)
 
             if checked_match:
                 task_text = checked_match.group(1).strip()
                 completion_date = checked_match.group(2)
 
                 # Extract added date if present: (added Jan 12)
-                added_match = re.search(r'\(added\s+([^)]+)\)', task_text)
+                added_match = _ADDED_DATE_RE.search(task_text)
                 added_date = added_match.group(1) if added_match else None
 
                 # Clean task text
-                task_text = re.sub(r'\s*\(added[^)]*\)\s*', '', task_text)
-                task_text = re.sub(r'\s*✅.*$', '', task_text)
-                task_text = re.sub(r'\s*⚠️.*$', '', task_text).strip()
+                task_text = _ADDED_NOTE_RE.sub('', task_text)
+                task_text = _COMPLETION_SUFFIX_RE.sub('', task_text)
+                task_text = _WARNING_SUFFIX_RE.sub('', task_text).strip()
 
                 return {
                     "text": task_text,
@@ -1147,16 +2282,16 @@ class VaultReader:
                 task_text = unchecked_match.group(1).strip()
 
                 # Extract added date if present
-                added_match = re.search(r'\(added\s+([^)]+)\)', task_text)
+                added_match = _ADDED_DATE_RE.search(task_text)
                 added_date = added_match.group(1) if added_match else None
 
                 # Extract warning/age info
-                age_match = re.search(r'⚠️\s*\*?(\d+)\s*days', task_text)
+                age_match = _AGE_DAYS_RE.search(task_text)
                 age_days = int(age_match.group(1)) if age_match else None
 
                 # Clean task text
-                task_text = re.sub(r'\s*\(added[^)]*\)\s*', '', task_text)
-                task_text = re.sub(r'\s*⚠️.*$', '', task_text).strip()
+                task_text = _ADDED_NOTE_RE.sub('', task_text)
+                task_text = _WARNING_SUFFIX_RE.sub('', task_text).strip()
 
                 return {
                     "text": task_text,
@@ -1200,11 +2335,12 @@ class VaultReader:
             # Extract all tasks from the note
             current_section = "Unknown"
 
-            for line in body.split('\n'):
+            # Iterate lines lazily rather than materializing body.split('\n')
+            for line in io.StringIO(body):
                 line_stripped = line.strip()
 
                 # Track current section
-                section_match = re.match(r'^#{2,4}\s+(.+)$', line_stripped)
+                section_match = _HEADING_RE.match(line_stripped)
                 if section_match:
                     current_section = section_match.group(1).strip()
                     if current_section not in result["by_section"]:
@@ -1303,8 +2439,7 @@ class VaultReader:
             return result
 
         # Note exists - read and update selectively
-        with open(note_path, "r", encoding="utf-8") as f:
-            existing_content = f.read()
+        existing_content = note_path.read_text(encoding="utf-8")
 
         # Parse frontmatter to get stored hashes
         parsed = frontmatter.loads(existing_content)
@@ -1313,8 +2448,17 @@ class VaultReader:
         # Track new hashes
         new_hashes = dict(stored_hashes)
 
-        # Process each section
-        updated_content = existing_content
+        # Collect the names of all sections present in one pass; notes
+        # without any markers skip the scan entirely
+        if "<!-- SECTION:" in existing_content:
+            present_sections = set(_SECTION_START_RE.findall(existing_content))
+        else:
+            present_sections = set()
+
+        # Process each section, collecting (start, end, replacement) spans
+        # against the original content so offsets stay valid
+        replacements: List[Tuple[int, int, str]] = []
+        updated_wrapped: List[Tuple[str, str]] = []
 
         for section_name, new_content in sections.items():
             # Compute hash of new content
@@ -1322,22 +2466,21 @@ class VaultReader:
             new_hashes[section_name] = new_hash
 
             # Check if section exists in note
-            section_start_marker = f"<!-- SECTION:{section_name}:START -->"
-            section_end_marker = f"<!-- SECTION:{section_name}:END -->"
-
-            if section_start_marker not in existing_content:
+            if section_name not in present_sections:
                 # Section doesn't exist - this is a new section
                 result["new_sections"].append(section_name)
                 logger.debug(f"Section '{section_name}' not found in note - skipping")
                 continue
 
-            # Extract current section content
-            current_content = self._extract_section_content(existing_content, section_name)
+            # Locate every marker block and extract current section content
+            spans = self._find_section_spans(existing_content, section_name)
 
-            if current_content is None:
+            if not spans:
                 result["errors"].append(f"Could not extract section: {section_name}")
                 continue
 
+            current_content = self._extract_section_content(existing_content, section_name, spans[0])
+
             # Check if section was modified
             stored_hash = stored_hashes.get(section_name, "")
 
@@ -1352,30 +2495,50 @@ class VaultReader:
             # Safe to update this section
             wrapped_content = self._wrap_section(new_content, section_name)
 
-            # Replace the section in content
-            pattern = rf'{re.escape(section_start_marker)}.*?{re.escape(section_end_marker)}'
-            updated_content = re.sub(pattern, wrapped_content, updated_content, flags=re.DOTALL)
+            # Queue a replacement for every block of this section; spliced in
+            # below as plain slices, so backslashes in generated content are
+            # never interpreted
+            for start, end in spans:
+                replacements.append((start, end, wrapped_content))
+            updated_wrapped.append((section_name, wrapped_content))
 
             result["updated_sections"].append(section_name)
 
+        replacements.sort()
+        overlapping = any(
+            replacements[i][1] > replacements[i + 1][0]
+            for i in range(len(replacements) - 1)
+        )
+
+        if overlapping:
+            # Nested or interleaved markers: replace section by section on the
+            # evolving text, as earlier replacements may remove later markers
+            logger.warning(f"Overlapping section markers in {note_path}; updating sections sequentially")
+            updated_content = existing_content
+            for section_name, wrapped_content in updated_wrapped:
+                start_marker, end_marker = _section_markers(section_name)
+                pattern = rf"{re.escape(start_marker)}.*?{re.escape(end_marker)}"
+                updated_content = re.sub(
+                    pattern, lambda _match: wrapped_content, updated_content, flags=re.DOTALL
+                )
+        else:
+            # Rebuild content from unchanged slices interleaved with new sections
+            pieces = []
+            last_end = 0
+            for start, end, wrapped_content in replacements:
+                pieces.append(existing_content[last_end:start])
+                pieces.append(wrapped_content)
+                last_end = end
+            pieces.append(existing_content[last_end:])
+            updated_content = "".join(pieces)
+
         # Update frontmatter with new hashes
         updated_content = self._update_frontmatter_hashes(updated_content, new_hashes)
 
         # Write back atomically
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix=".md",
-            dir=note_path.parent,
-            text=True
-        )
         try:
-            with open(temp_fd, "w", encoding="utf-8") as f:
-                f.write(updated_content)
-            shutil.move(temp_path, note_path)
+            self._replace_file_atomic(note_path, updated_content)
         except Exception as e:
-            try:
-                Path(temp_path).unlink()
-            except OSError:
-                pass
             raise OSError(f"Failed to update daily note: {e}")
 
         logger.info(
@@ -1395,55 +2558,67 @@ class VaultReader:
         normalized = ' '.join(content.split())
         return hashlib.md5(normalized.encode('utf-8')).hexdigest()[:12]
 
-    def _extract_section_content(self, full_content: str, section_name: str) -> Optional[str]:
-        """Extract content between section markers."""
-        start_marker = f"<!-- SECTION:{section_name}:START -->"
-        end_marker = f"<!-- SECTION:{section_name}:END -->"
+    def _find_section_spans(self, full_content: str, section_name: str) -> List[Tuple[int, int]]:
+        """Find the (start, end) offsets of every block of a section, markers included."""
+        start_marker, end_marker = _section_markers(section_name)
 
+        spans = []
         start_idx = full_content.find(start_marker)
-        end_idx = full_content.find(end_marker)
+        while start_idx != -1:
+            end_idx = full_content.find(end_marker, start_idx + len(start_marker))
+            if end_idx == -1:
+                break
+            end = end_idx + len(end_marker)
+            spans.append((start_idx, end))
+            start_idx = full_content.find(start_marker, end)
 
-        if start_idx == -1 or end_idx == -1:
-            return None
+        return spans
 
-        content_start = start_idx + len(start_marker)
-        return full_content[content_start:end_idx].strip()
+    def _extract_section_content(self, full_content: str, section_name: str, span: Tuple[int, int]) -> str:
+        """Extract content between the section markers of a block found by _find_section_spans."""
+        start_marker, end_marker = _section_markers(section_name)
+        return full_content[span[0] + len(start_marker):span[1] - len(end_marker)].strip()
 
     def _wrap_section(self, content: str, section_name: str) -> str:
         """Wrap content with section markers."""
-        return f"<!-- SECTION:{section_name}:START -->\n{content}\n<!-- SECTION:{section_name}:END -->"
+        start_marker, end_marker = _section_markers(section_name)
+        return f"{start_marker}\n{content}\n{end_marker}"
 
     def _get_stored_hashes(self, frontmatter: Dict[str, Any]) -> Dict[str, str]:
         """Extract stored section hashes from frontmatter."""
-        hashes_str = frontmatter.get("generated_sections", "")
-        if not hashes_str:
+        hashes = frontmatter.get("generated_sections")
+        if not hashes:
             return {}
 
-        hashes = {}
-        # Handle inline format: {section: hash, ...}
-        if '{' in str(hashes_str):
+        # Frontmatter parsing already yields a mapping; older notes may hold a string
+        if isinstance(hashes, str):
             try:
-                content = str(hashes_str).strip('{}')
-                for pair in content.split(','):
-                    if ':' in pair:
-                        key, value = pair.split(':', 1)
-                        hashes[key.strip()] = value.strip()
-            except Exception:
-                pass
+                hashes = yaml.load(hashes, Loader=_YAMLLoader)
+            except yaml.YAMLError:
+                return {}
 
-        return hashes
+        if not isinstance(hashes, dict):
+            return {}
+
+        return {str(k): str(v) for k, v in hashes.items()}
 
     def _format_section_hashes(self, hashes: Dict[str, str]) -> str:
         """Format section hashes for frontmatter."""
         if not hashes:
             return ""
-        hash_str = ", ".join(f"{k}: {v}" for k, v in hashes.items())
-        return f"generated_sections: {{{hash_str}}}\n"
+        # Block-style key with a flow-style mapping value, kept on one line
+        # (the C emitter needs an int width, so use the largest it accepts)
+        return yaml.dump(
+            {"generated_sections": hashes},
+            Dumper=_YAMLDumper,
+            default_flow_style=None,
+            sort_keys=False,
+            width=2**31 - 1,
+        )
 
     def _update_frontmatter_hashes(self, content: str, hashes: Dict[str, str]) -> str:
         """Update the generated_sections field in note content."""
-        hash_str = ", ".join(f"{k}: {v}" for k, v in hashes.items())
-        hash_line = f"generated_sections: {{{hash_str}}}"
+        hash_line = self._format_section_hashes(hashes).rstrip("\n") or "generated_sections: {}"
 
         # Check if we're in frontmatter
         if not content.startswith('---'):
@@ -1462,7 +2637,7 @@ class VaultReader:
             # Replace existing line
             fm_content = re.sub(
                 r'generated_sections:.*$',
-                hash_line,
+                lambda _: hash_line,
                 fm_content,
                 flags=re.MULTILINE
             )
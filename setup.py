@@ -14,7 +14,11 @@ setup(
         "pydantic>=2.0.0",
         "python-frontmatter>=1.0.0",
         "markdown>=3.5.0",
+        "pyyaml>=5.1",
     ],
+    extras_require={
+        "watch": ["watchdog>=2.1"],
+    },
     entry_points={
         "console_scripts": [
             "obsidian-vault-mcp=obsidian_vault_mcp.server:run_server",